@@ -0,0 +1,130 @@
+"""
+Call state store for Wisp
+Holds in-flight call state either in-process (TTL-bounded) or in Redis, so
+multiple Uvicorn workers / instances can share one view of active calls
+"""
+import os
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Redis is optional: it's only needed for multi-worker / multi-instance
+# deployments. Without REDIS_URL the store falls back to process-local memory.
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Stale call state ages out after an hour; full history lives in SQLite.
+# 10k in-flight calls is far beyond what a single worker screens in an hour,
+# so the cap only matters as a hard ceiling on memory.
+CALL_STATE_TTL = 3600
+CALL_STATE_MAX = 10_000
+
+
+class CallStateStore:
+    """Keyed store of per-call state dicts with TTL expiry.
+
+    Backed by Redis when a redis_url is given (shared across workers),
+    otherwise by an in-process TTLCache (single worker only).
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self._local: "TTLCache[str, Dict[str, Any]]" = TTLCache(maxsize=CALL_STATE_MAX, ttl=CALL_STATE_TTL)
+        # Striped locks guard the in-process backend's read-merge-write:
+        # concurrent webhook/screen/terminate coroutines for the same call
+        # would otherwise interleave between the get and the set and drop
+        # fields. The Redis backend doesn't need them — records live in
+        # hashes there, so each field merge is atomic server-side even
+        # across workers. 64 stripes bound the lock count.
+        self._locks = [asyncio.Lock() for _ in range(64)]
+        self._redis = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("REDIS_URL set but the redis package is not installed; using in-process call state")
+            else:
+                self._redis = aioredis.from_url(redis_url)
+                logger.info("Call state store backed by Redis")
+
+    @staticmethod
+    def _key(call_id: str) -> str:
+        return f"call:{call_id}"
+
+    def _lock(self, call_id: str) -> asyncio.Lock:
+        """Lock stripe for a call_id"""
+        return self._locks[hash(call_id) & 63]
+
+    @staticmethod
+    def _encode_fields(record: Dict[str, Any]) -> Dict[str, bytes]:
+        """orjson-encode each value for storage in a Redis hash field"""
+        return {field: orjson.dumps(value) for field, value in record.items()}
+
+    @staticmethod
+    def _decode_fields(raw: Dict[bytes, bytes]) -> Dict[str, Any]:
+        """Decode a Redis hash back into a state dict"""
+        return {field.decode(): orjson.loads(value) for field, value in raw.items()}
+
+    async def get(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch the state dict for a call, or None if unknown/expired"""
+        if self._redis is not None:
+            raw = await self._redis.hgetall(self._key(call_id))
+            return self._decode_fields(raw) if raw else None
+        return self._local.get(call_id)
+
+    async def set(self, call_id: str, record: Dict[str, Any]) -> None:
+        """Store (replace) the state dict for a call"""
+        if self._redis is not None:
+            key = self._key(call_id)
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._encode_fields(record))
+            pipe.expire(key, CALL_STATE_TTL)
+            await pipe.execute()
+        else:
+            self._local[call_id] = record
+
+    async def update(self, call_id: str, fields: Dict[str, Any], create: bool = False) -> Optional[Dict[str, Any]]:
+        """Merge fields into a call's state and return the merged dict.
+
+        Returns None (and stores nothing) when the call is unknown and
+        create is False, mirroring the old "update only if present" sites.
+        Merges can't lose fields to concurrent updates of the same call:
+        in Redis mode each record is a hash, so HSET merges the changed
+        fields server-side — atomically even across workers — while the
+        in-process read-merge-write runs under a striped per-call lock.
+        """
+        if self._redis is not None:
+            key = self._key(call_id)
+            if not create and not await self._redis.exists(key):
+                return None
+            mapping = dict(fields)
+            mapping["call_id"] = call_id
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.hset(key, mapping=self._encode_fields(mapping))
+            pipe.expire(key, CALL_STATE_TTL)
+            pipe.hgetall(key)
+            results = await pipe.execute()
+            return self._decode_fields(results[-1])
+        async with self._lock(call_id):
+            record = self._local.get(call_id)
+            if record is None:
+                if not create:
+                    return None
+                record = {"call_id": call_id}
+            record.update(fields)
+            self._local[call_id] = record
+            return record
+
+    async def aclose(self) -> None:
+        """Close the Redis connection on shutdown"""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# Single store shared by the app
+call_store = CallStateStore(os.getenv("REDIS_URL"))
@@ -55,20 +55,68 @@ async def get_db_connection():
         yield db
 
 
+# Upsert SQL shared by the single and batch write paths
+_UPSERT_CALL_SQL = """
+    INSERT OR REPLACE INTO calls (
+        call_id, from_number, to_number, started_at, status,
+        screening_verdict, screening_summary, screened_at, transcript,
+        terminated_at, transfer_initiated, transfer_target, transfer_initiated_at,
+        transferred_to, transferred_at, ended_at, created_at, updated_at
+    ) VALUES (
+        :call_id, :from_number, :to_number, :started_at, :status,
+        :screening_verdict, :screening_summary, :screened_at, :transcript,
+        :terminated_at, :transfer_initiated, :transfer_target, :transfer_initiated_at,
+        :transferred_to, :transferred_at, :ended_at, :created_at, :updated_at
+    )
+"""
+
+
+def _call_params(call_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a call record dict onto the upsert statement parameters"""
+    params = {
+        "call_id": call_data.get("call_id"),
+        "from_number": call_data.get("from_number"),
+        "to_number": call_data.get("to_number"),
+        "started_at": call_data.get("started_at"),
+        "status": call_data.get("status"),
+        "screening_verdict": call_data.get("screening_verdict"),
+        "screening_summary": call_data.get("screening_summary"),
+        "screened_at": call_data.get("screened_at"),
+        "transcript": call_data.get("transcript"),
+        "terminated_at": call_data.get("terminated_at"),
+        "transfer_initiated": 1 if call_data.get("transfer_initiated") else 0,
+        "transfer_target": call_data.get("transfer_target"),
+        "transfer_initiated_at": call_data.get("transfer_initiated_at"),
+        "transferred_to": call_data.get("transferred_to"),
+        "transferred_at": call_data.get("transferred_at"),
+        "ended_at": call_data.get("ended_at"),
+        "created_at": call_data.get("created_at"),
+        "updated_at": call_data.get("updated_at")
+    }
+
+    # Log verdict being saved for debugging
+    if params["screening_verdict"]:
+        logger.debug(f"Saving call {params['call_id']} with verdict: {params['screening_verdict']}")
+    elif params["screening_verdict"] is None:
+        logger.warning(f"Call {params['call_id']} being saved with NULL verdict - this may overwrite existing verdict!")
+
+    return params
+
+
 async def create_or_update_call(call_data: Dict[str, Any]) -> bool:
     """
     Create or update a call record in the database.
     Uses INSERT OR REPLACE to handle both new and existing calls.
-    
+
     Args:
         call_data: Dictionary containing call information
-        
+
     Returns:
         True if successful, False otherwise
     """
     try:
         now = datetime.utcnow().isoformat() + "Z"
-        
+
         # Ensure created_at and updated_at are set
         if "created_at" not in call_data:
             # Check if call exists to preserve original created_at
@@ -77,51 +125,11 @@ async def create_or_update_call(call_data: Dict[str, Any]) -> bool:
                 call_data["created_at"] = existing.get("created_at", now)
             else:
                 call_data["created_at"] = now
-        
+
         call_data["updated_at"] = now
-        
+
         async with get_db_connection() as db:
-            # Prepare parameters, ensuring we don't overwrite existing verdicts with None
-            params = {
-                "call_id": call_data.get("call_id"),
-                "from_number": call_data.get("from_number"),
-                "to_number": call_data.get("to_number"),
-                "started_at": call_data.get("started_at"),
-                "status": call_data.get("status"),
-                "screening_verdict": call_data.get("screening_verdict"),
-                "screening_summary": call_data.get("screening_summary"),
-                "screened_at": call_data.get("screened_at"),
-                "transcript": call_data.get("transcript"),
-                "terminated_at": call_data.get("terminated_at"),
-                "transfer_initiated": 1 if call_data.get("transfer_initiated") else 0,
-                "transfer_target": call_data.get("transfer_target"),
-                "transfer_initiated_at": call_data.get("transfer_initiated_at"),
-                "transferred_to": call_data.get("transferred_to"),
-                "transferred_at": call_data.get("transferred_at"),
-                "ended_at": call_data.get("ended_at"),
-                "created_at": call_data.get("created_at"),
-                "updated_at": call_data.get("updated_at")
-            }
-            
-            # Log verdict being saved for debugging
-            if params["screening_verdict"]:
-                logger.debug(f"Saving call {params['call_id']} with verdict: {params['screening_verdict']}")
-            elif params["screening_verdict"] is None:
-                logger.warning(f"Call {params['call_id']} being saved with NULL verdict - this may overwrite existing verdict!")
-            
-            await db.execute("""
-                INSERT OR REPLACE INTO calls (
-                    call_id, from_number, to_number, started_at, status,
-                    screening_verdict, screening_summary, screened_at, transcript,
-                    terminated_at, transfer_initiated, transfer_target, transfer_initiated_at,
-                    transferred_to, transferred_at, ended_at, created_at, updated_at
-                ) VALUES (
-                    :call_id, :from_number, :to_number, :started_at, :status,
-                    :screening_verdict, :screening_summary, :screened_at, :transcript,
-                    :terminated_at, :transfer_initiated, :transfer_target, :transfer_initiated_at,
-                    :transferred_to, :transferred_at, :ended_at, :created_at, :updated_at
-                )
-            """, params)
+            await db.execute(_UPSERT_CALL_SQL, _call_params(call_data))
             await db.commit()
             return True
     except Exception as e:
@@ -129,6 +137,42 @@ async def create_or_update_call(call_data: Dict[str, Any]) -> bool:
         return False
 
 
+async def create_or_update_calls(calls: list[Dict[str, Any]]) -> bool:
+    """
+    Create or update multiple call records in one connection and one commit.
+
+    Used by the background database writer to amortize SQLite connection and
+    commit cost across a batch of queued updates.
+
+    Args:
+        calls: List of call record dictionaries
+
+    Returns:
+        True if the batch committed, False otherwise
+    """
+    if not calls:
+        return True
+    try:
+        now = datetime.utcnow().isoformat() + "Z"
+        async with get_db_connection() as db:
+            for call_data in calls:
+                # Preserve original created_at within the same connection
+                if "created_at" not in call_data:
+                    async with db.execute(
+                        "SELECT created_at FROM calls WHERE call_id = ?",
+                        (call_data.get("call_id"),)
+                    ) as cursor:
+                        row = await cursor.fetchone()
+                    call_data["created_at"] = row[0] if row and row[0] else now
+                call_data["updated_at"] = now
+                await db.execute(_UPSERT_CALL_SQL, _call_params(call_data))
+            await db.commit()
+            return True
+    except Exception as e:
+        logger.error(f"Error batch-writing {len(calls)} calls to database: {e}", exc_info=True)
+        return False
+
+
 async def get_call(call_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve a call record by call_id.
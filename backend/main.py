@@ -8,27 +8,39 @@ import logging
 import hmac
 import hashlib
 import asyncio
-import json
-from typing import Dict, Any, Optional
+import random
+import time
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, Optional, Union
 from fastapi import FastAPI, HTTPException, Request, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 import httpx
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from screening import analyze_with_gemini, Verdict
-from database import init_database, create_or_update_call, get_all_calls, get_call, get_active_calls, get_stats, get_analytics_data, get_transcript_metrics
+from screening import analyze_with_gemini, warm_up_model, close_async_client, Verdict
+from call_state import call_store
+from database import init_database, create_or_update_call, create_or_update_calls, get_all_calls, get_call, get_active_calls, get_stats, get_analytics_data, get_transcript_metrics
 
-# Load environment variables
-load_dotenv()
+# Load environment variables; screening.py has usually already done this at
+# import, in which case the sentinel makes it a no-op
+if not os.getenv("WISP_ENV_LOADED"):
+    load_dotenv()
+    os.environ["WISP_ENV_LOADED"] = "1"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
-app = FastAPI(title="Wisp Call Screening API", version="1.0.0")
+app = FastAPI(
+    title="Wisp Call Screening API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -42,30 +54,152 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on application startup"""
+    """Initialize database and background writer on application startup"""
     await init_database()
     logger.info("Database initialized")
+    _spawn_background_task(_db_writer_loop())
+    # Pre-load the screening model so the first call doesn't pay the load
+    _spawn_background_task(warm_up_model())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on application shutdown"""
+    # Flush any call records still queued for the database writer
+    pending = []
+    while not _db_queue.empty():
+        pending.append(_db_queue.get_nowait())
+    if pending:
+        await create_or_update_calls(pending)
+    if _http_client is not None:
+        await _http_client.aclose()
+    await close_async_client()
+    await call_store.aclose()
+
+# Call state management lives in call_state.call_store: Redis-backed when
+# REDIS_URL is set (required for multi-worker deployments), otherwise a
+# TTL-bounded in-process cache.
+
+# Shared HTTP client for outbound Retell calls. A single long-lived client
+# pools connections to api.retellai.com, so screening decisions reuse
+# keep-alive connections instead of paying a TCP+TLS handshake per call.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+    return _http_client
+
+
+# Background tasks spawned from request handlers. Keep strong references so
+# tasks aren't garbage-collected mid-flight (standard asyncio idiom).
+_background_tasks: set = set()
+
+
+def _log_background_task_failure(task: asyncio.Task) -> None:
+    """Done-callback that surfaces exceptions from fire-and-forget tasks"""
+    if not task.cancelled() and task.exception():
+        logger.error("Background task failed: %s", task.exception())
+
+
+def _spawn_background_task(coro) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, so the caller can return
+    immediately. Exceptions are logged via a done-callback."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(_log_background_task_failure)
+    return task
+
 
-# Call state management (in-memory store for active calls)
-active_calls: Dict[str, Dict[str, Any]] = {}
+# Call records queued for the background database writer, so webhook and
+# screening handlers don't serialize on a connect+commit per write
+_db_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+_DB_BATCH_MAX = 128
+
+
+def _queue_db_write(call_record: Dict[str, Any]) -> None:
+    """Hand a call record to the background database writer"""
+    _db_queue.put_nowait(call_record)
+
+
+async def _db_writer_loop() -> None:
+    """Drain queued call records and flush them in coalesced batches.
+
+    Consecutive updates to the same call collapse into one merged record, so
+    a burst of webhook events costs a single upsert and commit per call.
+    """
+    while True:
+        batch = [await _db_queue.get()]
+        while not _db_queue.empty() and len(batch) < _DB_BATCH_MAX:
+            batch.append(_db_queue.get_nowait())
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for record in batch:
+            call_id = record.get("call_id")
+            if call_id in merged:
+                merged[call_id].update(record)
+            else:
+                merged[call_id] = dict(record)
+
+        try:
+            await create_or_update_calls(list(merged.values()))
+        except Exception as e:
+            logger.error("Database writer failed to flush batch: %s", e, exc_info=True)
 
 # Environment variables
 RETELL_API_KEY = os.getenv("RETELL_API_KEY")
 RETELL_WEBHOOK_SECRET = os.getenv("RETELL_WEBHOOK_SECRET")
 WISP_PHONE = "+14702282477"
 
-# Validate required environment variables
+# Pre-encode the webhook secret and build an HMAC template once at module
+# load, so per-webhook verification only pays for copy()+update() instead of
+# re-encoding the secret and redoing the HMAC key schedule every call.
+# hashlib.sha256 here routes through OpenSSL, which picks the SHA-NI/ARMv8
+# crypto kernels when the CPU has them; the digest must stay SHA-256 because
+# that's what Retell signs with.
+_RETELL_SECRET_BYTES = RETELL_WEBHOOK_SECRET.encode("utf-8") if RETELL_WEBHOOK_SECRET else None
+_HMAC_TEMPLATE = hmac.new(_RETELL_SECRET_BYTES, None, hashlib.sha256) if _RETELL_SECRET_BYTES else None
+
+# Prebuilt auth headers for every outbound Retell call: one dict and one
+# f-string at import instead of rebuilding them per request
+RETELL_HEADERS = {
+    "Authorization": f"Bearer {RETELL_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Validate required environment variables once at import. The default is a
+# warning so local development still works; set WISP_STRICT_ENV=true to fail
+# fast at startup instead of surfacing misconfiguration as 500s per request.
 if not RETELL_API_KEY:
+    if os.getenv("WISP_STRICT_ENV", "false").lower() == "true":
+        raise RuntimeError("RETELL_API_KEY is not set. Please check your .env file.")
     logger.warning("Missing required environment variables. Please check your .env file.")
 
 
 class ScreeningRequest(BaseModel):
     """Request model for call screening"""
-    call_id: str = Field(..., description="Unique call identifier from Retell")
-    transcript: str = Field(..., description="Call transcript to analyze")
+    call_id: str = Field(..., min_length=1, description="Unique call identifier from Retell")
+    transcript: str = Field(..., min_length=1, description="Call transcript to analyze")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional call metadata")
 
 
+class ToolScreeningRequest(BaseModel):
+    """Retell Custom Tool envelope wrapping a ScreeningRequest in 'args'"""
+    args: ScreeningRequest
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Tool-call metadata from Retell")
+
+
 class ScreeningResponse(BaseModel):
     """Response model for call screening"""
     verdict: Verdict = Field(..., description="SCAM or SAFE verdict")
@@ -80,6 +214,71 @@ class RetellWebhookEvent(BaseModel):
     data: Optional[Dict[str, Any]] = Field(None, description="Additional event data")
 
 
+# Cap on webhook request bodies; Retell events are a few KB at most
+_MAX_WEBHOOK_BODY = 64 * 1024
+
+
+async def _read_body_capped(request: Request, limit: int = _MAX_WEBHOOK_BODY) -> bytes:
+    """Read the request body, rejecting payloads over the size cap.
+
+    Checks Content-Length up front, and enforces the cap while streaming so
+    chunked requests can't buffer unbounded data either.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        raise HTTPException(status_code=413, detail="Request body too large")
+
+    buf = bytearray()
+    async for chunk in request.stream():
+        buf.extend(chunk)
+        if len(buf) > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    return bytes(buf)
+
+
+# Single-slot memo for _now_iso: lifecycle timestamps only carry second
+# precision in practice, so within one wall-clock second every caller can
+# share the same formatted string instead of re-running datetime + isoformat.
+_now_iso_memo = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with trailing Z.
+
+    Single place to produce lifecycle timestamps; uses the timezone-aware
+    datetime.now(timezone.utc) (utcnow() is deprecated in 3.12). The result
+    is memoized per whole second.
+    """
+    global _now_iso_memo
+    now = time.time()
+    second = int(now)
+    memo_second, memo_value = _now_iso_memo
+    if second == memo_second:
+        return memo_value
+    value = datetime.fromtimestamp(second, timezone.utc).isoformat().replace("+00:00", "Z")
+    _now_iso_memo = (second, value)
+    return value
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Exponential backoff with jitter for Retell API retries.
+
+    Honors a Retry-After header when the response carries one (e.g. on 429),
+    and adds random jitter so bursts of failing calls don't retry in lockstep.
+    The sub-second base (0.5s, 1s, 2s) keeps transient-failure recovery well
+    inside a live call's patience.
+    """
+    delay = 0.5 * (2 ** attempt)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+    return delay + random.uniform(0, 0.5)
+
+
 def verify_retell_webhook(payload: bytes, signature: str) -> bool:
     """Verify Retell webhook signature"""
     if not RETELL_WEBHOOK_SECRET:
@@ -87,209 +286,172 @@ def verify_retell_webhook(payload: bytes, signature: str) -> bool:
         return True
     
     try:
-        # Retell signature format: "v=<timestamp>,d=<signature>"
-        # Extract the signature part (after "d=")
-        if "," in signature:
-            parts = signature.split(",")
-            sig_part = None
-            for part in parts:
-                if part.startswith("d="):
-                    sig_part = part[2:]  # Remove "d=" prefix
-                    break
-            if not sig_part:
-                return False
-            signature = sig_part
-        
-        # Compute expected signature
-        expected_signature = hmac.new(
-            RETELL_WEBHOOK_SECRET.encode('utf-8'),
-            payload,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        # Retell signature format: "v=<timestamp>,d=<signature>"; a bare
+        # signature (no "d=" marker) is used as-is. Malformed values fall
+        # through to the hex decode below and fail verification there.
+        _, sep, rest = signature.partition("d=")
+        if sep:
+            signature = rest.split(",", 1)[0]
+
+
+        # Decode the provided signature to raw bytes; reject malformed hex
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+
+        # Compute expected signature from the pre-built HMAC template and
+        # compare as raw bytes (constant-time, no hexlify of the digest)
+        h = _HMAC_TEMPLATE.copy()
+        h.update(payload)
+        return hmac.compare_digest(provided, h.digest())
     except Exception as e:
-        logger.error(f"Error verifying webhook signature: {e}")
+        logger.error("Error verifying webhook signature: %s", e)
         return False
 
 
-async def terminate_retell_call(call_id: str, retry_count: int = 3) -> bool:
-    """Terminate a call via Retell AI API with retry logic"""
+# All Retell call mutations hit this endpoint; plain concat with the call_id
+# beats re-rendering an f-string per attempt
+_RETELL_UPDATE_CALL_BASE = "https://api.retellai.com/update-call/"
+
+
+@lru_cache(maxsize=1024)
+def _transfer_body(target_number: str, whisper_message: str) -> bytes:
+    """Pre-encoded transfer body, cached per (target, whisper) pair.
+
+    SAFE calls mostly transfer to the same target with a handful of
+    recurring whisper messages, so repeat transfers reuse the same bytes.
+    """
+    return orjson.dumps({
+        "transfer_phone_number": target_number,
+        "enable_voicemail_detection": False,
+        "whisper_message": whisper_message
+    })
+
+
+async def _retell_update_call(
+    call_id: str,
+    body: Union[Dict[str, Any], bytes],
+    state_updates: Dict[str, Any],
+    retry_count: int = 3,
+    ok_on_404: bool = False,
+    log_context: str = "update-call",
+) -> bool:
+    """POST a body to the Retell update-call endpoint with shared retry policy.
+
+    All Retell call mutations (terminate, warm transfer, custom transfer) go
+    through the same URL and auth; only the JSON body differs. On success the
+    state_updates are applied to the in-memory call state and the merged
+    record is persisted to the database in the background.
+    """
+    if not RETELL_API_KEY:
+        logger.error("RETELL_API_KEY not configured, cannot call Retell %s", log_context)
+        return False
+
+    url = _RETELL_UPDATE_CALL_BASE + call_id
+    # Serialize the body once, not per retry attempt; callers with fully
+    # static bodies can pass pre-encoded bytes directly
+    payload_bytes = body if isinstance(body, bytes) else orjson.dumps(body)
     for attempt in range(retry_count):
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"https://api.retellai.com/update-call/{call_id}",
-                    headers={
-                        "Authorization": f"Bearer {RETELL_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "end_call": True,
-                        "end_call_message": "This call has been blocked. Please remove this number from your call list. Goodbye."
-                    },
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                logger.info(f"Successfully terminated call {call_id}")
-                
-                # Update call state (in-memory)
-                terminated_at = datetime.utcnow().isoformat() + "Z"
-                if call_id in active_calls:
-                    active_calls[call_id]["status"] = "terminated"
-                    active_calls[call_id]["terminated_at"] = terminated_at
-                
-                # Persist termination to database
-                try:
-                    call_record = {
-                        "call_id": call_id,
-                        "status": "terminated",
-                        "terminated_at": terminated_at
-                    }
-                    # Merge with existing call data if available
-                    if call_id in active_calls:
-                        call_record.update(active_calls[call_id])
-                    await create_or_update_call(call_record)
-                except Exception as e:
-                    logger.error(f"Failed to persist termination to database: {e}")
-                
-                return True
+            logger.info("Calling Retell %s for call %s (attempt %s/%s)", log_context, call_id, attempt + 1, retry_count)
+            logger.debug("Retell %s payload: %s", log_context, body)
+
+            response = await _get_http_client().post(
+                url,
+                headers=RETELL_HEADERS,
+                content=payload_bytes,
+            )
+
+            logger.debug("Response status: %s", response.status_code)
+            try:
+                logger.debug("Response body: %s", response.json())
+            except Exception:
+                logger.debug("Response text: %s", response.text)
+
+            response.raise_for_status()
+            logger.info("Retell %s succeeded for call %s", log_context, call_id)
+
+            # Update shared call state
+            state = await call_store.update(call_id, state_updates)
+
+            # Persist to database via the background writer
+            call_record = {"call_id": call_id, **state_updates}
+            # Merge with existing call data if available
+            if state:
+                call_record.update(state)
+            _queue_db_write(call_record)
+
+            return True
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                logger.warning(f"Call {call_id} not found, may have already ended")
-                return True  # Consider this success if call doesn't exist
+            status = e.response.status_code
+            if status == 404:
+                logger.warning("Call %s not found (404) for %s; call may have already ended", call_id, log_context)
+                return ok_on_404
+            if status in (400, 401, 403):
+                # Non-retryable client errors; retrying won't change the outcome
+                logger.error("Non-retryable error %s from Retell %s for call %s", status, log_context, call_id)
+                return False
             if attempt < retry_count - 1:
-                logger.warning(f"Error terminating call {call_id} (attempt {attempt + 1}/{retry_count}): {e}")
-                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+                logger.warning("Retell %s failed for call %s (attempt %s/%s): %s", log_context, call_id, attempt + 1, retry_count, status)
+                await asyncio.sleep(_retry_delay(attempt, e.response))
             else:
-                logger.error(f"Error terminating Retell call after {retry_count} attempts: {e}")
+                logger.error("Retell %s failed for call %s after %s attempts: %s", log_context, call_id, retry_count, status)
                 return False
         except Exception as e:
+            logger.error("Error calling Retell %s for call %s: %s", log_context, call_id, e)
             if attempt < retry_count - 1:
-                logger.warning(f"Error terminating call {call_id} (attempt {attempt + 1}/{retry_count}): {e}")
-                await asyncio.sleep(1 * (attempt + 1))
+                await asyncio.sleep(_retry_delay(attempt))
             else:
-                logger.error(f"Error terminating Retell call after {retry_count} attempts: {e}")
                 return False
     return False
 
 
+# Fully static terminate body, pre-encoded once at import
+_TERMINATE_BODY = orjson.dumps({
+    "end_call": True,
+    "end_call_message": "This call has been blocked. Please remove this number from your call list. Goodbye."
+})
+
+
+async def terminate_retell_call(call_id: str, retry_count: int = 3) -> bool:
+    """Terminate a call via Retell AI API with retry logic"""
+    return await _retell_update_call(
+        call_id,
+        _TERMINATE_BODY,
+        {"status": "terminated", "terminated_at": _now_iso()},
+        retry_count=retry_count,
+        ok_on_404=True,  # call already gone counts as terminated
+        log_context="terminate",
+    )
+
+
 async def invoke_custom_transfer_call(call_id: str, target_number: str, whisper_message: str, retry_count: int = 3) -> bool:
     """
     Invoke custom transfer_call method via Retell API.
-    
+
     This function attempts to trigger your custom transfer_call method in Retell.
     The exact API endpoint and payload format may vary depending on how your
     custom method is configured in Retell. You may need to adjust the payload
     structure based on your Retell configuration.
     """
-    if not RETELL_API_KEY:
-        logger.error("RETELL_API_KEY not configured, cannot invoke custom transfer")
-        return False
-    
-    for attempt in range(retry_count):
-        try:
-            # Try different payload formats that might work with custom transfer methods
-            # Adjust these based on your Retell custom tool configuration
-            payload = {
-                "transfer_phone_number": target_number,
-                "whisper_message": whisper_message,
-                "enable_voicemail_detection": False
-            }
-            
-            # Alternative: If your custom method expects different parameters, uncomment and modify:
-            # payload = {
-            #     "action": "transfer",
-            #     "phone_number": target_number,
-            #     "message": whisper_message
-            # }
-            
-            url = f"https://api.retellai.com/update-call/{call_id}"
-            logger.info(f"Invoking custom transfer_call for call {call_id} to {target_number} (attempt {attempt + 1}/{retry_count})")
-            logger.debug(f"Custom transfer payload: {payload}")
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {RETELL_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload,
-                    timeout=10.0
-                )
-                
-                logger.debug(f"Response status: {response.status_code}")
-                try:
-                    response_body = response.json()
-                    logger.debug(f"Response body: {response_body}")
-                except:
-                    response_text = response.text
-                    logger.debug(f"Response text: {response_text}")
-                
-                response.raise_for_status()
-                logger.info(f"Successfully invoked custom transfer_call for call {call_id} to {target_number}")
-                
-                # Update call state
-                transfer_initiated_at = datetime.utcnow().isoformat() + "Z"
-                if call_id in active_calls:
-                    active_calls[call_id]["transfer_initiated"] = True
-                    active_calls[call_id]["transfer_target"] = target_number
-                    active_calls[call_id]["transfer_initiated_at"] = transfer_initiated_at
-                    active_calls[call_id]["transfer_method"] = "custom"
-                
-                # Persist to database
-                try:
-                    call_record = {
-                        "call_id": call_id,
-                        "transfer_initiated": True,
-                        "transfer_target": target_number,
-                        "transfer_initiated_at": transfer_initiated_at,
-                        "transfer_method": "custom"
-                    }
-                    if call_id in active_calls:
-                        call_record.update(active_calls[call_id])
-                    await create_or_update_call(call_record)
-                except Exception as e:
-                    logger.error(f"Failed to persist custom transfer to database: {e}")
-                
-                return True
-        except httpx.HTTPStatusError as e:
-            error_details = {
-                "status_code": e.response.status_code,
-                "url": url,
-                "call_id": call_id
-            }
-            try:
-                error_body = e.response.json()
-                error_details["error_body"] = error_body
-                logger.error(f"HTTP error invoking custom transfer: {error_details}")
-            except:
-                error_text = e.response.text
-                error_details["error_text"] = error_text
-                logger.error(f"HTTP error invoking custom transfer: {error_details}")
-            
-            if e.response.status_code == 404:
-                logger.warning(f"Call {call_id} not found (404) for custom transfer. Call may have ended or endpoint is incorrect.")
-                return False
-            elif attempt < retry_count - 1:
-                logger.warning(f"Error invoking custom transfer (attempt {attempt + 1}/{retry_count}): {e.response.status_code}")
-                await asyncio.sleep(1 * (attempt + 1))
-            else:
-                logger.error(f"Failed to invoke custom transfer after {retry_count} attempts")
-                return False
-        except Exception as e:
-            logger.error(f"Unexpected error invoking custom transfer: {e}", exc_info=True)
-            if attempt < retry_count - 1:
-                await asyncio.sleep(1 * (attempt + 1))
-            else:
-                return False
-    return False
+    return await _retell_update_call(
+        call_id,
+        _transfer_body(target_number, whisper_message),
+        {
+            "transfer_initiated": True,
+            "transfer_target": target_number,
+            "transfer_initiated_at": _now_iso(),
+            "transfer_method": "custom"
+        },
+        retry_count=retry_count,
+        log_context="custom transfer",
+    )
 
 
 async def warm_transfer_retell_call(call_id: str, target_number: str, whisper_message: str, retry_count: int = 3, use_custom: bool = False) -> bool:
     """Initiate warm transfer via Retell AI API with retry logic
-    
+
     Args:
         call_id: The call ID to transfer
         target_number: Phone number to transfer to
@@ -300,264 +462,137 @@ async def warm_transfer_retell_call(call_id: str, target_number: str, whisper_me
     # Use custom transfer method if requested
     if use_custom:
         return await invoke_custom_transfer_call(call_id, target_number, whisper_message, retry_count)
-    
-    if not RETELL_API_KEY:
-        logger.error("RETELL_API_KEY not configured, cannot initiate warm transfer")
-        return False
-    
+
     # Verify call is still active before attempting transfer
     call_status = None
-    if call_id in active_calls:
-        call_status = active_calls[call_id].get("status")
+    state = await call_store.get(call_id)
+    if state is not None:
+        call_status = state.get("status")
         if call_status == "ended" or call_status == "terminated":
-            logger.warning(f"Call {call_id} has status '{call_status}', cannot transfer")
+            logger.warning("Call %s has status '%s', cannot transfer", call_id, call_status)
             return False
     else:
-        logger.warning(f"Call {call_id} not in active_calls, checking database...")
+        logger.warning("Call %s not in call state store, checking database...", call_id)
         # Check database to see if call exists and is active
         try:
             db_call = await get_call(call_id)
             if db_call:
                 call_status = db_call.get("status")
                 if call_status in ["ended", "terminated"]:
-                    logger.warning(f"Call {call_id} has status '{call_status}' in database, cannot transfer")
-                    return False
-                logger.info(f"Call {call_id} found in database with status '{call_status}', proceeding with transfer")
-            else:
-                logger.warning(f"Call {call_id} not found in database or active_calls, but attempting transfer anyway (may be timing issue)")
-        except Exception as e:
-            logger.warning(f"Error checking database for call {call_id}: {e}, proceeding with transfer attempt")
-    
-    for attempt in range(retry_count):
-        try:
-            payload = {
-                "transfer_phone_number": target_number,
-                "enable_voicemail_detection": False,
-                "whisper_message": whisper_message
-            }
-            
-            url = f"https://api.retellai.com/update-call/{call_id}"
-            logger.info(f"Attempting warm transfer for call {call_id} to {target_number} (attempt {attempt + 1}/{retry_count})")
-            logger.debug(f"Transfer payload: {payload}")
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        "Authorization": f"Bearer {RETELL_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload,
-                    timeout=10.0
-                )
-                
-                # Log response details for debugging
-                logger.debug(f"Response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
-                
-                try:
-                    response_body = response.json()
-                    logger.debug(f"Response body: {response_body}")
-                except:
-                    response_text = response.text
-                    logger.debug(f"Response text: {response_text}")
-                
-                response.raise_for_status()
-                logger.info(f"Successfully initiated warm transfer for call {call_id} to {target_number}")
-                
-                # Update call state (in-memory)
-                transfer_initiated_at = datetime.utcnow().isoformat() + "Z"
-                if call_id in active_calls:
-                    active_calls[call_id]["transfer_initiated"] = True
-                    active_calls[call_id]["transfer_target"] = target_number
-                    active_calls[call_id]["transfer_initiated_at"] = transfer_initiated_at
-                
-                # Persist transfer initiation to database
-                try:
-                    call_record = {
-                        "call_id": call_id,
-                        "transfer_initiated": True,
-                        "transfer_target": target_number,
-                        "transfer_initiated_at": transfer_initiated_at
-                    }
-                    # Merge with existing call data if available
-                    if call_id in active_calls:
-                        call_record.update(active_calls[call_id])
-                    await create_or_update_call(call_record)
-                except Exception as e:
-                    logger.error(f"Failed to persist transfer initiation to database: {e}")
-                
-                return True
-        except httpx.HTTPStatusError as e:
-            # Log detailed error information
-            error_details = {
-                "status_code": e.response.status_code,
-                "url": url,
-                "call_id": call_id
-            }
-            try:
-                error_body = e.response.json()
-                error_details["error_body"] = error_body
-                logger.error(f"HTTP error details: {error_details}")
-            except:
-                error_text = e.response.text
-                error_details["error_text"] = error_text
-                logger.error(f"HTTP error details: {error_details}")
-            
-            if e.response.status_code == 404:
-                logger.warning(f"Call {call_id} not found (404), cannot transfer. Call may have already ended or call_id is invalid.")
-                # Check if call exists in database
-                try:
-                    db_call = await get_call(call_id)
-                    if db_call:
-                        logger.info(f"Call {call_id} exists in database with status: {db_call.get('status')}")
-                    else:
-                        logger.warning(f"Call {call_id} not found in database either")
-                except Exception as db_error:
-                    logger.error(f"Error checking database for call {call_id}: {db_error}")
-                return False
-            elif e.response.status_code == 401:
-                logger.error(f"Authentication failed (401). Check RETELL_API_KEY configuration.")
-                return False
-            elif e.response.status_code == 400:
-                logger.error(f"Bad request (400). Check payload format and call_id format.")
-                return False
-            else:
-                if attempt < retry_count - 1:
-                    logger.warning(f"Error initiating transfer for call {call_id} (attempt {attempt + 1}/{retry_count}): {e.response.status_code}")
-                    await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
-                else:
-                    logger.error(f"Error initiating warm transfer after {retry_count} attempts: {e.response.status_code}")
+                    logger.warning("Call %s has status '%s' in database, cannot transfer", call_id, call_status)
                     return False
-        except httpx.RequestError as e:
-            logger.error(f"Request error (network/timeout) for call {call_id}: {e}")
-            if attempt < retry_count - 1:
-                await asyncio.sleep(1 * (attempt + 1))
+                logger.info("Call %s found in database with status '%s', proceeding with transfer", call_id, call_status)
             else:
-                return False
+                logger.warning("Call %s not found in database or call state, but attempting transfer anyway (may be timing issue)", call_id)
         except Exception as e:
-            logger.error(f"Unexpected error initiating transfer for call {call_id}: {e}", exc_info=True)
-            if attempt < retry_count - 1:
-                await asyncio.sleep(1 * (attempt + 1))
-            else:
-                return False
-    return False
+            logger.warning("Error checking database for call %s: %s, proceeding with transfer attempt", call_id, e)
+
+    return await _retell_update_call(
+        call_id,
+        _transfer_body(target_number, whisper_message),
+        {
+            "transfer_initiated": True,
+            "transfer_target": target_number,
+            "transfer_initiated_at": _now_iso()
+        },
+        retry_count=retry_count,
+        log_context="warm transfer",
+    )
+
+
+async def _handle_scam(call_id: str, summary: str) -> None:
+    """SCAM flow: terminate the call via Retell (with retry logic)"""
+    logger.info("SCAM detected for call %s. Terminating call.", call_id)
+    if not await terminate_retell_call(call_id):
+        logger.error("Failed to terminate call %s", call_id)
+
+
+async def _handle_safe(call_id: str, summary: str) -> None:
+    """SAFE flow: warm transfer + whisper message via Retell (with retry logic)"""
+    logger.info("SAFE call detected for call %s. Initiating warm transfer.", call_id)
+    whisper_message = f"Wisp here. Verified: {summary}. Press any key to bridge."
+    # Set USE_CUSTOM_TRANSFER=true to use the custom transfer_call method
+    use_custom_transfer = os.getenv("USE_CUSTOM_TRANSFER", "false").lower() == "true"
+    if not await warm_transfer_retell_call(call_id, WISP_PHONE, whisper_message, use_custom=use_custom_transfer):
+        logger.error("Failed to initiate warm transfer for call %s", call_id)
+
+
+# Verdict -> action dispatch table for the screening endpoint. Adding a new
+# verdict (e.g. UNKNOWN, VOICEMAIL) means adding a handler here, not another
+# branch in the hot path.
+_HANDLERS: Dict[Verdict, Callable[[str, str], Awaitable[None]]] = {
+    Verdict.SCAM: _handle_scam,
+    Verdict.SAFE: _handle_safe,
+}
 
 
 @app.post("/wisp-screen", response_model=ScreeningResponse)
-async def wisp_screen(request: Request):
+async def wisp_screen(body: Union[ScreeningRequest, ToolScreeningRequest]):
     """
     Main screening endpoint for Wisp call screening service.
-    
+
     Analyzes call transcript with Gemma3:1b via Ollama and executes
     appropriate actions based on verdict (SCAM or SAFE).
     Works with both Custom Tool calls and webhook-driven flows.
-    
+
     Accepts two request formats:
     1. Direct format: {"call_id": "...", "transcript": "...", "metadata": {...}}
     2. Retell Custom Tool format: {"args": {"call_id": "...", "transcript": "..."}, ...}
     """
-    
-    # Parse request body
-    try:
-        body = await request.json()
-    except Exception as e:
-        logger.error(f"Failed to parse request body: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
-    
-    # Extract call_id and transcript from either format
-    # Retell Custom Tool format: {"args": {"call_id": "...", "transcript": "..."}}
-    # Direct format: {"call_id": "...", "transcript": "..."}
-    if isinstance(body, dict) and "args" in body and isinstance(body["args"], dict):
-        # Retell Custom Tool format
-        call_id = body["args"].get("call_id")
-        transcript = body["args"].get("transcript")
-        metadata = body.get("metadata") or body["args"].get("metadata")
+    # Pydantic has already validated whichever shape arrived; just unwrap
+    # the Custom Tool envelope if present
+    if isinstance(body, ToolScreeningRequest):
+        screening = body.args
+        metadata = body.metadata or screening.metadata
     else:
-        # Direct format
-        call_id = body.get("call_id") if isinstance(body, dict) else None
-        transcript = body.get("transcript") if isinstance(body, dict) else None
-        metadata = body.get("metadata") if isinstance(body, dict) else None
-    
-    # Validate required fields
-    if not call_id:
-        raise HTTPException(status_code=422, detail="Field 'call_id' is required")
-    if not transcript:
-        raise HTTPException(status_code=422, detail="Field 'transcript' is required")
-    
-    logger.info(f"Received screening request for call {call_id}")
-    
-    # Check if call is in active calls (from webhook)
-    call_state = active_calls.get(call_id, {})
-    
+        screening = body
+        metadata = screening.metadata
+    call_id = screening.call_id
+    transcript = screening.transcript
+
+    logger.info("Received screening request for call %s", call_id)
+
     # Step 1: Analyze transcript with Gemma
     verdict, summary = await analyze_with_gemini(transcript)
-    
-    logger.info(f"Screening result for call {call_id}: verdict={verdict.value}, summary={summary}")
-    
-    # Update call state with screening result (in-memory)
-    screened_at = datetime.utcnow().isoformat() + "Z"
-    if call_id in active_calls:
-        active_calls[call_id]["screening_verdict"] = verdict.value
-        active_calls[call_id]["screening_summary"] = summary
-        active_calls[call_id]["screened_at"] = screened_at
-        active_calls[call_id]["transcript"] = transcript
-    
+
+    logger.info("Screening result for call %s: verdict=%s, summary=%s", call_id, verdict.value, summary)
+
+    # Update shared call state with the screening result
+    screened_at = _now_iso()
+    state = await call_store.update(call_id, {
+        "screening_verdict": verdict.value,
+        "screening_summary": summary,
+        "screened_at": screened_at,
+        "transcript": transcript,
+    })
+
     # Persist screening results and transcript to database
     try:
-        # First, get existing call data from database to preserve all fields
-        existing_call = await get_call(call_id)
-        
-        call_record = {
-            "call_id": call_id,
-        }
-        
-        # Merge with existing database data first (to preserve other fields)
-        if existing_call:
-            call_record.update(existing_call)
-            logger.debug(f"Existing call data for {call_id}: verdict={existing_call.get('screening_verdict')}")
-        
-        # Then merge with active_calls data (which may have more recent updates)
-        if call_id in active_calls:
-            call_record.update(active_calls[call_id])
-            logger.debug(f"After merging active_calls for {call_id}: verdict={call_record.get('screening_verdict')}")
-        
+        # Start from the stored row (INSERT OR REPLACE would otherwise null
+        # out fields the call state no longer carries) and mutate it in place
+        call_record = await get_call(call_id) or {"call_id": call_id}
+
+        # Merge call state (which may have more recent updates)
+        if state:
+            call_record.update(state)
+
         # CRITICAL: Set screening fields LAST to ensure they're never overwritten
         call_record["screening_verdict"] = verdict.value
         call_record["screening_summary"] = summary
         call_record["screened_at"] = screened_at
         call_record["transcript"] = transcript
-        
-        logger.info(f"Persisting call {call_id} with verdict={call_record['screening_verdict']}")
-        await create_or_update_call(call_record)
-        logger.info(f"Successfully persisted call {call_id} with verdict={call_record['screening_verdict']}")
+
+        logger.info("Queueing persist for call %s with verdict=%s", call_id, call_record['screening_verdict'])
+        _queue_db_write(call_record)
     except Exception as e:
-        logger.error(f"Failed to persist screening results to database: {e}", exc_info=True)
-    
-    # Step 2: Execute based on verdict
-    if verdict == Verdict.SCAM:
-        # SCAM flow: Terminate call
-        logger.info(f"SCAM detected for call {call_id}. Terminating call.")
-        
-        # Terminate call via Retell (with retry logic)
-        termination_success = await terminate_retell_call(call_id)
-        if not termination_success:
-            logger.error(f"Failed to terminate call {call_id}")
-        
-    else:  # SAFE
-        # SAFE flow: Warm transfer + Whisper
-        logger.info(f"SAFE call detected for call {call_id}. Initiating warm transfer.")
-        
-        # Create whisper message
-        whisper_message = f"Wisp here. Verified: {summary}. Press any key to bridge."
-        
-        # Initiate warm transfer via Retell (with retry logic)
-        # Set use_custom=True to use custom transfer_call method
-        use_custom_transfer = os.getenv("USE_CUSTOM_TRANSFER", "false").lower() == "true"
-        transfer_success = await warm_transfer_retell_call(call_id, WISP_PHONE, whisper_message, use_custom=use_custom_transfer)
-        if not transfer_success:
-            logger.error(f"Failed to initiate warm transfer for call {call_id}")
+        logger.error("Failed to persist screening results to database: %s", e, exc_info=True)
     
+    # Step 2: Execute based on verdict (table-driven dispatch), in the
+    # background. Retell's Custom Tool caller only needs the verdict and
+    # summary; holding the response open for the terminate/transfer round
+    # trip would add a full Retell RTT to every screening.
+    _spawn_background_task(_HANDLERS[verdict](call_id, summary))
+
     return ScreeningResponse(
         verdict=verdict,
         summary=summary,
@@ -583,7 +618,7 @@ async def get_calls_endpoint(
         calls = await get_all_calls(limit=limit, status=status, verdict=verdict)
         return {"calls": calls, "count": len(calls)}
     except Exception as e:
-        logger.error(f"Error fetching calls: {e}", exc_info=True)
+        logger.error("Error fetching calls: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching calls: {str(e)}")
 
 
@@ -597,7 +632,7 @@ async def get_active_calls_endpoint():
         calls = await get_active_calls()
         return {"calls": calls, "count": len(calls)}
     except Exception as e:
-        logger.error(f"Error fetching active calls: {e}", exc_info=True)
+        logger.error("Error fetching active calls: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching active calls: {str(e)}")
 
 
@@ -614,7 +649,7 @@ async def get_call_endpoint(call_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching call {call_id}: {e}", exc_info=True)
+        logger.error("Error fetching call %s: %s", call_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching call: {str(e)}")
 
 
@@ -632,7 +667,7 @@ async def get_stats_endpoint():
         stats = await get_stats()
         return stats
     except Exception as e:
-        logger.error(f"Error fetching stats: {e}", exc_info=True)
+        logger.error("Error fetching stats: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
 
 
@@ -662,7 +697,7 @@ async def get_analytics_endpoint(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching analytics: {e}", exc_info=True)
+        logger.error("Error fetching analytics: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching analytics: {str(e)}")
 
 
@@ -679,21 +714,40 @@ async def get_transcript_metrics_endpoint():
         metrics = await get_transcript_metrics()
         return metrics
     except Exception as e:
-        logger.error(f"Error fetching transcript metrics: {e}", exc_info=True)
+        logger.error("Error fetching transcript metrics: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error fetching transcript metrics: {str(e)}")
 
 
+# Ollama liveness probe, cached so monitoring hitting /health every second
+# doesn't become a per-request RPC against the Ollama daemon. Failures still
+# surface within the TTL.
+_OLLAMA_PROBE_TTL = 5.0
+_ollama_probe = (0.0, False)
+
+
+async def _probe_ollama() -> bool:
+    """Check Ollama reachability, caching the result for a few seconds"""
+    global _ollama_probe
+    checked_at, available = _ollama_probe
+    now = time.monotonic()
+    if now - checked_at < _OLLAMA_PROBE_TTL:
+        return available
+    try:
+        import ollama
+        # ollama.list() is a synchronous HTTP call; keep it off the event loop
+        await asyncio.to_thread(ollama.list)
+        available = True
+    except Exception:
+        available = False
+    _ollama_probe = (now, available)
+    return available
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     from screening import OLLAMA_MODEL
-    import ollama
-    ollama_available = False
-    try:
-        ollama.list()
-        ollama_available = True
-    except:
-        pass
+    ollama_available = await _probe_ollama()
     return {
         "status": "healthy",
         "service": "Wisp Call Screening API",
@@ -704,6 +758,7 @@ async def health_check():
 
 
 @app.post("/retell-webhook")
+@app.post("/")
 async def retell_webhook(
     request: Request,
     x_retell_signature: Optional[str] = Header(None, alias="X-Retell-Signature")
@@ -711,10 +766,13 @@ async def retell_webhook(
     """
     Retell webhook endpoint for call event handling.
     Handles call_started, call_ended, call_transferred events.
+    Registered on both /retell-webhook and / since Retell can be configured
+    to POST to either path.
     """
     try:
-        # Get raw body for signature verification
-        body = await request.body()
+        # Get raw body for signature verification (size-capped so an oversized
+        # or malicious payload can't buffer unbounded memory)
+        body = await _read_body_capped(request)
         
         # Verify webhook signature if secret is configured
         # Note: For development/testing, signature verification failures are logged but don't block requests
@@ -725,110 +783,94 @@ async def retell_webhook(
                 # In production, uncomment the line below to reject invalid signatures:
                 # raise HTTPException(status_code=401, detail="Invalid webhook signature")
         
-        # Parse webhook payload from body (already read, can't use request.json())
+        # Parse webhook payload from the already-read bytes. orjson accepts
+        # bytes directly, so there's no intermediate decode, and the raw body
+        # is read exactly once whether or not a signature is verified —
+        # branching to request.json() in the unsigned case would re-buffer
+        # the body through Starlette and lose the size cap.
         try:
-            body_str = body.decode('utf-8')
-            payload = json.loads(body_str)
-        except json.JSONDecodeError as e:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON payload: {str(e)}")
-        except UnicodeDecodeError as e:
-            raise HTTPException(status_code=400, detail=f"Invalid body encoding: {str(e)}")
         
         event_type = payload.get("event")
         call_data = payload.get("call", {})
         call_id = call_data.get("call_id")
         
-        logger.info(f"Received Retell webhook: {event_type} for call {call_id}")
+        logger.info("Received Retell webhook: %s for call %s", event_type, call_id)
         
         # Handle different event types
         if event_type == "call_started":
-            # Store call state in memory
+            # Store call state in the shared store
             call_record = {
                 "call_id": call_id,
                 "from_number": call_data.get("from_number"),
                 "to_number": call_data.get("to_number"),
-                "started_at": datetime.utcnow().isoformat() + "Z",
+                "started_at": _now_iso(),
                 "status": "active"
             }
-            active_calls[call_id] = call_record
-            
-            # Persist to database
-            try:
-                await create_or_update_call(call_record)
-            except Exception as e:
-                logger.error(f"Failed to persist call_started to database: {e}")
-            
-            logger.info(f"Call {call_id} started, stored in active calls and database")
-            
+            await call_store.set(call_id, call_record)
+
+            # Persist to database via the background writer
+            _queue_db_write(call_record)
+
+            logger.info("Call %s started, stored in call state and database", call_id)
+
         elif event_type == "call_ended":
-            # Update call state (in-memory)
-            ended_at = datetime.utcnow().isoformat() + "Z"
-            if call_id in active_calls:
-                active_calls[call_id]["status"] = "ended"
-                active_calls[call_id]["ended_at"] = ended_at
-            
+            # Update shared call state
+            ended_at = _now_iso()
+            state = await call_store.update(call_id, {"status": "ended", "ended_at": ended_at})
+
             # Persist call end to database
             try:
-                # First, get existing call data from database to preserve all fields (especially screening_verdict)
-                existing_call = await get_call(call_id)
-                
-                call_record = {
-                    "call_id": call_id,
-                    "status": "ended",
-                    "ended_at": ended_at
-                }
-                
-                # Merge with existing database data first (to preserve screening_verdict, etc.)
-                if existing_call:
-                    call_record.update(existing_call)
-                    logger.debug(f"Call {call_id} ended - existing verdict: {existing_call.get('screening_verdict')}")
-                
-                # Then merge with active_calls data (which may have more recent updates)
-                if call_id in active_calls:
-                    call_record.update(active_calls[call_id])
-                
-                # Ensure status and ended_at are set correctly (active_calls might have overwritten)
+                # Start from the stored row (preserves screening_verdict etc.)
+                # and mutate it in place rather than building a fresh dict
+                call_record = await get_call(call_id) or {"call_id": call_id}
+
+                # Merge call state (which may have more recent updates)
+                if state:
+                    call_record.update(state)
+
+                # Set status and ended_at LAST so stale cached values never win
                 call_record["status"] = "ended"
                 call_record["ended_at"] = ended_at
-                
-                logger.info(f"Persisting call_ended for {call_id} with verdict: {call_record.get('screening_verdict')}")
-                await create_or_update_call(call_record)
+
+                logger.info("Persisting call_ended for %s with verdict: %s", call_id, call_record.get('screening_verdict'))
+                _queue_db_write(call_record)
             except Exception as e:
-                logger.error(f"Failed to persist call_ended to database: {e}")
-            
-            logger.info(f"Call {call_id} ended")
-            
+                logger.error("Failed to persist call_ended to database: %s", e)
+
+            logger.info("Call %s ended", call_id)
+
         elif event_type == "call_transferred":
-            # Update call state with transfer information (in-memory)
-            transferred_at = datetime.utcnow().isoformat() + "Z"
+            # Update shared call state with transfer information
+            transferred_at = _now_iso()
             transferred_to = call_data.get("transfer_phone_number")
-            if call_id in active_calls:
-                active_calls[call_id]["transferred_to"] = transferred_to
-                active_calls[call_id]["transferred_at"] = transferred_at
-            
-            # Persist transfer to database
+            state = await call_store.update(call_id, {
+                "transferred_to": transferred_to,
+                "transferred_at": transferred_at,
+            })
+
+            # Persist transfer to database; the merged state already carries
+            # the transfer fields, so reuse it instead of rebuilding a dict
             try:
-                call_record = {
+                _queue_db_write(state or {
                     "call_id": call_id,
                     "transferred_to": transferred_to,
                     "transferred_at": transferred_at
-                }
-                # Merge with existing call data if available
-                if call_id in active_calls:
-                    call_record.update(active_calls[call_id])
-                await create_or_update_call(call_record)
+                })
             except Exception as e:
-                logger.error(f"Failed to persist call_transferred to database: {e}")
-            
-            logger.info(f"Call {call_id} transferred to {transferred_to}")
+                logger.error("Failed to persist call_transferred to database: %s", e)
+
+            logger.info("Call %s transferred to %s", call_id, transferred_to)
         
         return {"status": "ok", "event": event_type, "call_id": call_id}
         
     except HTTPException as e:
-        logger.error(f"HTTPException in Retell webhook: {e.status_code} - {e.detail}")
+        logger.error("HTTPException in Retell webhook: %s - %s", e.status_code, e.detail)
         raise
     except Exception as e:
-        logger.error(f"Error processing Retell webhook: {e}", exc_info=True)
+        logger.error("Error processing Retell webhook: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -861,12 +903,13 @@ async def transfer_call_endpoint(request: Request):
     target = target_number or WISP_PHONE
     whisper = whisper_message or f"Wisp here. Press any key to bridge."
     
-    logger.info(f"Transfer call requested for call {call_id} to {target} (custom={use_custom})")
+    logger.info("Transfer call requested for call %s to %s (custom=%s)", call_id, target, use_custom)
     
-    # Check if call exists in active calls or database
+    # Check if call exists in call state or database
+    state = await call_store.get(call_id)
     call_info = {
-        "in_active_calls": call_id in active_calls,
-        "active_call_status": active_calls.get(call_id, {}).get("status") if call_id in active_calls else None
+        "in_active_calls": state is not None,
+        "active_call_status": state.get("status") if state else None
     }
     
     try:
@@ -875,7 +918,7 @@ async def transfer_call_endpoint(request: Request):
         if db_call:
             call_info["db_status"] = db_call.get("status")
     except Exception as e:
-        logger.warning(f"Error checking database for call {call_id}: {e}")
+        logger.warning("Error checking database for call %s: %s", call_id, e)
         call_info["db_check_error"] = str(e)
     
     # Attempt the transfer
@@ -911,12 +954,13 @@ async def test_transfer_endpoint(
     target = target_number or WISP_PHONE
     whisper_message = "Test transfer from Wisp. Press any key to bridge."
     
-    logger.info(f"Test transfer requested for call {call_id} to {target} (custom={use_custom})")
+    logger.info("Test transfer requested for call %s to %s (custom=%s)", call_id, target, use_custom)
     
-    # Check if call exists in active calls or database
+    # Check if call exists in call state or database
+    state = await call_store.get(call_id)
     call_info = {
-        "in_active_calls": call_id in active_calls,
-        "active_call_status": active_calls.get(call_id, {}).get("status") if call_id in active_calls else None
+        "in_active_calls": state is not None,
+        "active_call_status": state.get("status") if state else None
     }
     
     try:
@@ -925,7 +969,7 @@ async def test_transfer_endpoint(
         if db_call:
             call_info["db_status"] = db_call.get("status")
     except Exception as e:
-        logger.warning(f"Error checking database for call {call_id}: {e}")
+        logger.warning("Error checking database for call %s: %s", call_id, e)
         call_info["db_check_error"] = str(e)
     
     # Attempt the transfer
@@ -944,35 +988,41 @@ async def test_transfer_endpoint(
     }
 
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "service": "Wisp Call Screening API",
-        "version": "1.0.0",
-        "endpoints": {
-            "screening": "/wisp-screen",
-            "webhook": "/retell-webhook",
-            "health": "/health",
-            "transfer_call": "/api/transfer-call",
-            "test_transfer": "/api/test-transfer"
-        }
+# The root listing never changes at runtime, so it's encoded once at import
+# and served as raw bytes instead of re-serializing the dict per request
+_ROOT_JSON = orjson.dumps({
+    "service": "Wisp Call Screening API",
+    "version": "1.0.0",
+    "endpoints": {
+        "screening": "/wisp-screen",
+        "webhook": "/retell-webhook",
+        "health": "/health",
+        "transfer_call": "/api/transfer-call",
+        "test_transfer": "/api/test-transfer"
     }
+})
 
 
-@app.post("/")
-async def root_post(request: Request):
-    """
-    Root POST endpoint - handles Retell webhooks when configured to use root path.
-    Retell webhooks can be configured to POST to / or /retell-webhook
-    """
-    # Delegate to the webhook handler
-    x_retell_signature = request.headers.get("X-Retell-Signature")
-    return await retell_webhook(request, x_retell_signature)
-
-
+@app.get("/")
+async def root():
+    """Root endpoint"""
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools ship with uvicorn[standard] and roughly double pure
+    # async throughput over the default loop/parser. WEB_CONCURRENCY>1 spreads
+    # load across cores; set REDIS_URL as well so workers share call state.
+    # access_log=False drops uvicorn's per-request log formatting; request
+    # handling is already traced by our own logger calls.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level=os.getenv("UVICORN_LOG_LEVEL", "info"),
+        access_log=False,
+    )
@@ -3,15 +3,24 @@ Call screening evaluation module
 Handles Gemma-based call transcript analysis via Ollama
 """
 import os
+import re
 import sys
+import json
 import asyncio
+import hashlib
 import logging
-from typing import Tuple
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 from enum import Enum
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once per process: the sentinel lets re-imports
+# (main.py imports this module after its own load_dotenv) skip the .env
+# stat/open/parse filesystem work
+if not os.getenv("WISP_ENV_LOADED"):
+    load_dotenv()
+    os.environ["WISP_ENV_LOADED"] = "1"
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,7 +38,7 @@ try:
     import ollama
     logger.info("Ollama library imported successfully")
 except ImportError as e:
-    logger.error(f"Could not import ollama package: {e}")
+    logger.error("Could not import ollama package: %s", e)
     logger.error("Please install it: pip install ollama")
     ollama = None
 
@@ -40,17 +49,376 @@ class Verdict(str, Enum):
     SAFE = "SAFE"
 
 
-# Verify Ollama connection and model availability
+# High-confidence scam phrases. If one appears in the transcript the call is
+# almost always a scam, so we short-circuit to SCAM without paying for a
+# model round trip. Ambiguous transcripts still go to the model.
+_SCAM_RE = re.compile(
+    r'\b(irs|ssn|social security|gift card|warranty (?:expir|renew)\w*'
+    r'|one-time code|remote access|arrest warrant|wire transfer'
+    r'|bitcoin|crypto wallet|refund department|virus (?:detected|on your)'
+    r'|account (?:has been )?suspended|microsoft (?:tech|technical) support)\b',
+    re.IGNORECASE,
+)
+
+# Tokens that mark a free-text model reply as a scam verdict when the
+# structured parse fails; scanned over the uppercased reply exactly once.
+_SCAM_TOKENS = frozenset({"SCAM", "SPAM", "FRAUD"})
+
+# Transcripts this short carry no screenable signal; the model would only
+# hallucinate an intent from them.
+_MIN_TRANSCRIPT_TOKENS = 10
+
+# Cap on transcript characters sent to the model. Prefill scales with input
+# length, and for a 5-word-summary task only the tail of a long call matters;
+# the cap also keeps adversarially long inputs inside the num_ctx window.
+_MAX_TRANSCRIPT_CHARS = 4000
+
+# Static instruction sent as the system message on every call. Keeping it
+# byte-identical in its own leading message lets the server reuse the KV
+# cache for the prompt prefix across calls — only the user-message
+# transcript varies, so most of the prefill cost is paid once. The JSON
+# instruction pairs with format="json" on the chat call, which constrains
+# decoding to valid JSON server-side.
+_SYSTEM_PROMPT = (
+    "You are a call screening AI. Analyze the user's call transcript and "
+    "determine if it's a SCAM or SAFE call. Respond with JSON only, in this "
+    'exact shape: {"verdict": "SCAM or SAFE", "summary": "exactly 5 words '
+    "describing caller's intent\"}"
+)
+
+# Single-pass parser for the model's "VERDICT: ... SUMMARY: ..." reply format
+_RESP_RE = re.compile(
+    r"VERDICT:\s*(SCAM|SAFE)\b.*?SUMMARY:\s*(.+?)(?:\n|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Bound concurrent model calls so a burst of /wisp-screen requests doesn't
+# pile dozens of in-flight generations onto the Ollama daemon at once.
+# Ollama serializes (or degrades badly) above its configured parallel count,
+# so the limit tracks OLLAMA_NUM_PARALLEL — set both together when raising it.
+_MODEL_SEM = asyncio.Semaphore(int(os.getenv("OLLAMA_NUM_PARALLEL", "2")))
+
+# Generation options. The reply is one short JSON object, so cap decoding at
+# 40 tokens — decode time dominates screening latency at ~10-50ms/token — and
+# sample greedily so identical transcripts produce identical verdicts.
+# num_ctx must fit the worst case or Ollama truncates the prompt silently
+# and screens text the model never saw: a _MAX_TRANSCRIPT_CHARS transcript
+# is ~1000-1200 tokens, plus the system prompt, chat template and the
+# 40-token reply — 1536 covers that with margin while still avoiding KV
+# cache for the model's full default window.
+_GENERATE_OPTIONS = {
+    "num_predict": 40,
+    "temperature": 0.0,
+    "top_k": 1,
+    "top_p": 1.0,
+    "num_ctx": 1536,
+}
+
+# Keep model weights resident between calls. The default 5-minute keep_alive
+# unloads the model during quiet spells, making the next caller pay the full
+# multi-second load; an hour matches the verdict-cache TTL.
+_KEEP_ALIVE = "1h"
+
+# Shared async client for the Ollama daemon, created on first use so import
+# never opens a connection. One client means one reusable connection pool.
+_async_client = None
+
+
+def _get_async_client():
+    """Return the shared ollama.AsyncClient, creating it on first use"""
+    global _async_client
+    if _async_client is None:
+        # The extra kwarg goes to the underlying httpx.AsyncClient, whose
+        # keep-alive pool already reuses connections between calls; the
+        # timeout bounds a wedged daemon instead of hanging a screening
+        _async_client = ollama.AsyncClient(host=OLLAMA_HOST, timeout=60)
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared Ollama client's connection pool on shutdown"""
+    global _async_client
+    if _async_client is not None:
+        # ollama.AsyncClient has no public close; reach for its httpx client
+        await _async_client._client.aclose()
+        _async_client = None
+
+# Verdict cache keyed by a fingerprint of the normalized transcript.
+# Common scam scripts (IRS, warranty, SSA) repeat near-verbatim across calls,
+# so a hit returns the stored verdict without invoking the model at all.
+_VERDICT_CACHE: "OrderedDict[str, Tuple[Verdict, str, float]]" = OrderedDict()
+_VERDICT_CACHE_MAX = 10_000
+_VERDICT_CACHE_TTL = 3600.0  # seconds before a cached verdict goes stale
+
+
+# Punctuation is noise for verdict purposes: transcription runs of the same
+# call differ in commas and hyphens far more often than in words
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def _normalize_transcript(transcript: str) -> str:
+    """Normalize a transcript for cache lookup.
+
+    Lowercases, strips punctuation and collapses whitespace so
+    near-duplicate transcripts (re-transcriptions, replayed voicemail,
+    test harness variants) hash to the same cache key.
+    """
+    return " ".join(_PUNCT_RE.sub("", transcript.lower()).split())
+
+
+def _transcript_fingerprint(transcript: str) -> str:
+    """Lightweight fingerprint of the model plus normalized transcript.
+
+    The model name is part of the key so a cached verdict never outlives an
+    OLLAMA_MODEL change (e.g. swapping gemma variants between deploys).
+    """
+    normalized = _normalize_transcript(transcript)
+    keyed = OLLAMA_MODEL + "\x00" + normalized
+    return hashlib.blake2b(keyed.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _verdict_cache_get(key: str) -> Optional[Tuple[Verdict, str]]:
+    """Look up a cached verdict, evicting it if expired"""
+    entry = _VERDICT_CACHE.get(key)
+    if entry is None:
+        return None
+    verdict, summary, cached_at = entry
+    if time.monotonic() - cached_at > _VERDICT_CACHE_TTL:
+        del _VERDICT_CACHE[key]
+        return None
+    _VERDICT_CACHE.move_to_end(key)
+    return verdict, summary
+
+
+def _verdict_cache_put(key: str, verdict: Verdict, summary: str) -> None:
+    """Store a verdict, evicting least-recently-used entries past the cap"""
+    _VERDICT_CACHE[key] = (verdict, summary, time.monotonic())
+    _VERDICT_CACHE.move_to_end(key)
+    while len(_VERDICT_CACHE) > _VERDICT_CACHE_MAX:
+        _VERDICT_CACHE.popitem(last=False)
+
+
+# Connectivity-check cache: ollama.list() is a full HTTP round trip, so the
+# result is reused for a minute instead of being re-verified per screening.
+_CHECK_TTL = 60.0
+_last_check_ts = 0.0
+_last_check_ok = False
+
+
+# Verify Ollama connection and model availability. Not called on the
+# screening hot path; kept for diagnostics and command-line use.
 def _check_ollama_connection():
-    """Check if Ollama is available and model exists"""
+    """Check if Ollama is available, caching the result for a minute"""
+    global _last_check_ts, _last_check_ok
     if not ollama:
         return False
+    now = time.monotonic()
+    if now - _last_check_ts < _CHECK_TTL:
+        return _last_check_ok
     try:
         ollama.list()
-        return True
+        _last_check_ok = True
     except Exception as e:
-        logger.warning(f"Could not connect to Ollama: {e}")
-        return False
+        logger.warning("Could not connect to Ollama: %s", e)
+        _last_check_ok = False
+    _last_check_ts = now
+    return _last_check_ok
+
+
+async def warm_up_model() -> None:
+    """Load the screening model into Ollama ahead of the first real call.
+
+    A cold generate pays the full model load — seconds even for gemma3:1b —
+    so a one-token request at startup moves that cost off the first caller,
+    and keep_alive keeps the weights resident afterwards.
+    """
+    if not ollama:
+        return
+    try:
+        await _get_async_client().generate(
+            model=OLLAMA_MODEL,
+            prompt=" ",
+            stream=False,
+            keep_alive=_KEEP_ALIVE,
+            options={"num_predict": 1}
+        )
+        logger.info("Model %s warmed up and pinned for %s", OLLAMA_MODEL, _KEEP_ALIVE)
+    except Exception as e:
+        logger.warning("Model warm-up failed: %s", e)
+
+
+# Micro-batching: screenings that arrive within a few milliseconds of each
+# other are combined into one numbered prompt and answered by a single model
+# call, amortizing model scheduling and prefill across the batch. Each
+# caller awaits its own future; the collector resolves them.
+_BATCH_MAX = 4
+_BATCH_WINDOW = 0.01  # seconds to wait for more arrivals after the first
+
+_BATCH_SYSTEM_PROMPT = (
+    "You are a call screening AI. You will receive several numbered call "
+    "transcripts. For each one, determine if it's a SCAM or SAFE call. "
+    "Respond with JSON only, keyed by transcript number, in this exact "
+    'shape: {"1": {"verdict": "SCAM or SAFE", "summary": "exactly 5 words '
+    "describing caller's intent\"}, \"2\": {...}}"
+)
+
+_batch_queue = None
+_pending_tasks = set()
+
+
+def _spawn_task(coro):
+    """Schedule a coroutine, keeping a strong reference until it finishes"""
+    task = asyncio.get_running_loop().create_task(coro)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+    return task
+
+
+def _ensure_collector():
+    """Start the batch collector on first use and return its queue"""
+    global _batch_queue
+    if _batch_queue is None:
+        _batch_queue = asyncio.Queue()
+        _spawn_task(_collector())
+    return _batch_queue
+
+
+def _coerce_result(raw_verdict, raw_summary) -> Optional[Tuple[Verdict, str]]:
+    """Validate a parsed verdict/summary pair; None when either is unusable"""
+    raw_verdict = str(raw_verdict or '').upper()
+    if raw_verdict not in ('SCAM', 'SAFE'):
+        return None
+    summary = str(raw_summary or '').strip()
+    if not summary:
+        return None
+    verdict = Verdict.SCAM if raw_verdict == 'SCAM' else Verdict.SAFE
+    # Normalize to exactly 5 words: pad with "call" and slice in one go
+    return verdict, ' '.join((summary.split() + ["call"] * 5)[:5])
+
+
+async def _model_screen(transcript: str) -> Tuple[Verdict, str]:
+    """Screen one transcript with its own model call.
+
+    format="json" has the server constrain decoding to valid JSON, so
+    parsing is one json.loads, with text-format fallbacks kept as safety
+    nets for a model that sidesteps the constraint.
+    """
+    async with _MODEL_SEM:
+        response = await _get_async_client().chat(
+            model=OLLAMA_MODEL,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": transcript},
+            ],
+            format="json",
+            stream=False,
+            keep_alive=_KEEP_ALIVE,
+            options=_GENERATE_OPTIONS
+        )
+
+    response_text = response.get('message', {}).get('content', '').strip()
+
+    result = None
+    try:
+        parsed = json.loads(response_text)
+        result = _coerce_result(parsed.get('verdict'), parsed.get('summary'))
+    except (ValueError, TypeError, AttributeError):
+        # Model sidestepped the JSON constraint; try the legacy text format
+        m = _RESP_RE.search(response_text)
+        if m:
+            result = _coerce_result(m.group(1), m.group(2))
+    if result is not None:
+        return result
+
+    # Fallback parsing: uppercase once, then scan for scam tokens
+    upper_text = response_text.upper()
+    verdict = Verdict.SCAM if any(token in upper_text for token in _SCAM_TOKENS) else Verdict.SAFE
+    words = response_text.split()
+    summary = ' '.join(words[:5]) if len(words) >= 5 else response_text[:50]
+    return verdict, ' '.join((summary.split() + ["call"] * 5)[:5])
+
+
+async def _resolve_single(transcript: str, future: asyncio.Future) -> None:
+    """Screen one transcript and resolve its caller's future"""
+    try:
+        result = await _model_screen(transcript)
+        if not future.done():
+            future.set_result(result)
+    except Exception as e:
+        if not future.done():
+            future.set_exception(e)
+
+
+async def _screen_batch(batch) -> None:
+    """Answer several queued screenings with one numbered model call.
+
+    Items whose entry comes back missing or unparsable fall back to their
+    own single-transcript call rather than failing the caller.
+    """
+    numbered = "\n\n".join(
+        f"Transcript {i}:\n{transcript}"
+        for i, (transcript, _) in enumerate(batch, 1)
+    )
+    parsed = {}
+    try:
+        # Give the batch proportionally more room to decode — and to prefill:
+        # up to _BATCH_MAX transcripts of _MAX_TRANSCRIPT_CHARS each would
+        # overflow the single-call num_ctx, and Ollama truncates silently,
+        # which would yield confident verdicts for transcripts the model
+        # never saw
+        options = dict(
+            _GENERATE_OPTIONS,
+            num_predict=_GENERATE_OPTIONS["num_predict"] * len(batch),
+            num_ctx=_GENERATE_OPTIONS["num_ctx"] * len(batch),
+        )
+        async with _MODEL_SEM:
+            response = await _get_async_client().chat(
+                model=OLLAMA_MODEL,
+                messages=[
+                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": numbered},
+                ],
+                format="json",
+                stream=False,
+                keep_alive=_KEEP_ALIVE,
+                options=options
+            )
+        parsed = json.loads(response.get('message', {}).get('content', ''))
+        if not isinstance(parsed, dict):
+            parsed = {}
+    except Exception as e:
+        logger.warning("Batched screening of %d transcripts failed (%s); falling back to single calls", len(batch), e)
+
+    for i, (transcript, future) in enumerate(batch, 1):
+        if future.done():
+            continue
+        entry = parsed.get(str(i))
+        result = _coerce_result(entry.get('verdict'), entry.get('summary')) if isinstance(entry, dict) else None
+        if result is not None:
+            future.set_result(result)
+        else:
+            _spawn_task(_resolve_single(transcript, future))
+
+
+async def _collector() -> None:
+    """Drain queued screenings in small batches and dispatch them"""
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = asyncio.get_running_loop().time() + _BATCH_WINDOW
+        while len(batch) < _BATCH_MAX:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Dispatch without awaiting so the collector keeps draining; the
+        # semaphore still bounds how many model calls run at once
+        if len(batch) == 1:
+            _spawn_task(_resolve_single(*batch[0]))
+        else:
+            _spawn_task(_screen_batch(batch))
 
 
 async def analyze_with_gemini(transcript: str) -> Tuple[Verdict, str]:
@@ -60,85 +428,49 @@ async def analyze_with_gemini(transcript: str) -> Tuple[Verdict, str]:
     
     Note: Function name kept as analyze_with_gemini for backward compatibility
     """
+    # Short-circuit on obvious scam phrases before touching the model
+    match = _SCAM_RE.search(transcript)
+    if match:
+        logger.info("Scam keyword prefilter matched '%s', skipping model call", match.group(0))
+        return Verdict.SCAM, "Matched known scam pattern here"
+
+    # Empty or near-empty transcripts go straight to SAFE without a model call
+    if len(transcript.split()) < _MIN_TRANSCRIPT_TOKENS:
+        logger.info("Transcript under %d tokens, skipping model call", _MIN_TRANSCRIPT_TOKENS)
+        return Verdict.SAFE, "Transcript too short to analyze"
+
     if not ollama:
         logger.error("Ollama library not available")
         return Verdict.SAFE, "Unable to analyze call transcript"
-    
-    if not _check_ollama_connection():
-        logger.error("Ollama server not available")
-        return Verdict.SAFE, "Unable to analyze call transcript"
-    
-    prompt = f"""You are a call screening AI. Analyze the following call transcript and determine if it's a SCAM or SAFE call.
 
-Call Transcript:
-{transcript}
+    # No pre-flight connectivity check here: a down daemon surfaces as an
+    # exception from the chat call below, which already falls back to SAFE
 
-Instructions:
-1. Determine if this is a SCAM or SAFE call based on the caller's intent and behavior.
-2. Provide a verdict: SCAM or SAFE
-3. Provide a 5-word summary of the caller's intent (exactly 5 words, no more, no less).
+    # Check the verdict cache before paying for a model call
+    cache_key = _transcript_fingerprint(transcript)
+    cached = _verdict_cache_get(cache_key)
+    if cached is not None:
+        logger.info("Verdict cache hit for transcript fingerprint %s", cache_key)
+        return cached
 
-Respond in this exact format:
-VERDICT: [SCAM or SAFE]
-SUMMARY: [exactly 5 words describing caller's intent]
-"""
+    # Bound prefill cost: keep only the tail of pathologically long transcripts
+    if len(transcript) > _MAX_TRANSCRIPT_CHARS:
+        logger.warning("Transcript length %d exceeds %d chars, truncating to the tail", len(transcript), _MAX_TRANSCRIPT_CHARS)
+        transcript = transcript[-_MAX_TRANSCRIPT_CHARS:]
 
     try:
-        response = ollama.generate(
-            model=OLLAMA_MODEL,
-            prompt=prompt
-        )
-        
-        # Handle response structure - could be dict or generator
-        if isinstance(response, dict):
-            response_text = response.get('response', '').strip()
-        else:
-            # If it's a generator (streaming), collect the response
-            response_text = ''
-            for chunk in response:
-                if isinstance(chunk, dict):
-                    response_text += chunk.get('response', '')
-                else:
-                    response_text += str(chunk)
-            response_text = response_text.strip()
-        
-        # Parse response
-        verdict = None
-        summary = None
-        
-        for line in response_text.split('\n'):
-            if line.startswith('VERDICT:'):
-                verdict_str = line.split(':', 1)[1].strip().upper()
-                verdict = Verdict.SCAM if verdict_str == 'SCAM' else Verdict.SAFE
-            elif line.startswith('SUMMARY:'):
-                summary = line.split(':', 1)[1].strip()
-        
-        if not verdict or not summary:
-            # Fallback parsing
-            if 'SCAM' in response_text.upper():
-                verdict = Verdict.SCAM
-            else:
-                verdict = Verdict.SAFE
-            
-            # Extract summary (try to get 5 words)
-            words = response_text.split()
-            summary = ' '.join(words[:5]) if len(words) >= 5 else response_text[:50]
-        
-        # Ensure summary is exactly 5 words
-        summary_words = summary.split()
-        if len(summary_words) > 5:
-            summary = ' '.join(summary_words[:5])
-        elif len(summary_words) < 5:
-            # Pad with generic words if needed
-            while len(summary_words) < 5:
-                summary_words.append("call")
-            summary = ' '.join(summary_words)
-        
-        logger.info(f"Gemma verdict: {verdict}, Summary: {summary}")
+        # Hand the transcript to the batch collector and wait for its
+        # verdict; nearby arrivals share one model call
+        future = asyncio.get_running_loop().create_future()
+        _ensure_collector().put_nowait((transcript, future))
+        verdict, summary = await future
+
+        _verdict_cache_put(cache_key, verdict, summary)
+        logger.info("Gemma verdict: %s, Summary: %s", verdict, summary)
         return verdict, summary
-        
+
     except Exception as e:
-        logger.error(f"Error analyzing with Gemma: {e}")
+        logger.error("Error analyzing with Gemma: %s", e)
         # Default to SAFE if analysis fails
         return Verdict.SAFE, "Unable to analyze call transcript"
 